@@ -0,0 +1,31 @@
+"""
+Shared thread pool for short background tasks (frame prefetch, folder
+listings, metadata compaction), so each caller doesn't pay thread startup on its own.
+
+Use as `_executor.EXEC.submit(...)`; the pool is created on first access.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # Only bounded tasks go here; long-lived loops (e.g. the player decoder)
+                # get their own daemon thread so they can't starve the pool
+                _pool = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) + 4,
+                                           thread_name_prefix="fmv-worker")
+    return _pool
+
+def __getattr__(name):
+    # Lazy module attribute: `EXEC` resolves to the singleton executor
+    if name == "EXEC":
+        return get_executor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,10 +10,22 @@ import threading
 import queue
 import os
 import sys
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 import numpy as np
 from PIL import Image, ImageTk
 import librosa
 
+# Try to import PyAV for multi-threaded video decoding in the player, fallback to OpenCV
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
 # Import project modules
 from audio_features import extract_features, audio_profile
 from fractals import JULIA_PRESETS, julia_audio_frames_2d, IFS_PRESETS, ifs_audio_frames_2d, PALETTES, PALETTE_COLORS, rgb_to_hex
@@ -34,6 +46,45 @@ DEFAULT_FPS = 60
 ensure_video_directories()
 
 
+@dataclass
+class GenerationConfig:
+    """Snapshot of the GUI settings used for a single video generation.
+
+    Field names match the keys of ``FractalMusicGUI.settings`` so the snapshot can be
+    taken in one pass on the Tk thread and read freely from the worker thread.
+    """
+    fps: int
+    width: int
+    height: int
+    intensity: float
+    palette: str
+    power: float
+    dynamic_dimensions: bool
+    dimension_factor: float
+    use_custom_palette: bool
+    custom_main_color: str
+    custom_accent_color: str
+    quality_preset: str
+    max_iterations: int
+    z_real: float
+    z_imag: float
+    c_base_real: float
+    c_base_imag: float
+    rotation_enabled: bool
+    rotation_velocity: float  # Rotations per second
+    trim_enabled: bool
+    trim_start: float
+    trim_end: float
+    normalize_audio: bool
+    fractal_type: str
+    ifs_preset: str
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> 'GenerationConfig':
+        """Read every Tk variable once (must be called from the Tk main thread)."""
+        return cls(**{f.name: settings[f.name].get() for f in fields(cls)})
+
+
 class FractalMusicGUI:
     def __init__(self, root):
         self.root = root
@@ -50,6 +101,23 @@ class FractalMusicGUI:
         self.is_generating = False
         self.generation_cancelled = False  # Flag to cancel generation
         self.message_queue = queue.Queue()
+        self._ffmpeg_exe = self._resolve_ffmpeg()  # Resolved once, reused by every generation
+        self.thumbnail_executor = ThreadPoolExecutor(max_workers=1)  # Decodes video list thumbnails off the UI thread
+        self._thumbnail_futures = []  # Pending video list thumbnail decodes
+        self._thumbnail_token = 0  # Bumped per list refresh so stale thumbnails are ignored
+        self._scroll_pending = False  # Coalesces video list scrollregion updates
+
+        # Widgets created later in setup_ui; callbacks check for None until then
+        self.trim_start_label = None
+        self.trim_end_label = None
+        self.trim_start_scale = None
+        self.trim_end_scale = None
+        self.trim_start_minus_btn = None
+        self.trim_start_plus_btn = None
+        self.trim_end_minus_btn = None
+        self.trim_end_plus_btn = None
+        self.main_color_canvas = None
+        self.accent_color_canvases = []
 
         # Customization settings
         # Set random default palette
@@ -109,6 +177,7 @@ class FractalMusicGUI:
 
         # Check for messages from background threads
         self.root.after(100, self.check_queue)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.setup_ui()
         self.refresh_audio_list()
@@ -128,6 +197,28 @@ class FractalMusicGUI:
         if quality in quality_iterations:
             self.settings['max_iterations'].set(quality_iterations[quality])
 
+    def on_close(self):
+        """Close the app without waiting for queued thumbnail decodes."""
+        # Executor workers are joined at interpreter exit, after draining their queue
+        self.thumbnail_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    def _resolve_ffmpeg(self):
+        """Locate the ffmpeg executable (imageio_ffmpeg first, then system PATH)."""
+        ffmpeg_exe = None
+        # Try to get ffmpeg from imageio_ffmpeg
+        try:
+            import imageio_ffmpeg
+            ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+        except:
+            pass
+
+        # Fallback to system ffmpeg
+        if not ffmpeg_exe:
+            ffmpeg_exe = shutil.which('ffmpeg')
+
+        return ffmpeg_exe
+
     def setup_ui(self):
         """Create the main UI layout."""
         # Main container
@@ -924,6 +1015,13 @@ class FractalMusicGUI:
         self.video_list_data = []
         self.video_thumbnails = []  # Store thumbnail references
 
+        # Drop thumbnails still being decoded for the previous list
+        self._thumbnail_token += 1
+        token = self._thumbnail_token
+        for future in self._thumbnail_futures:
+            future.cancel()
+        self._thumbnail_futures = []
+
         try:
             all_videos = get_all_videos()
             if all_videos:
@@ -943,50 +1041,8 @@ class FractalMusicGUI:
                     content_container = ttk.Frame(item_frame)
                     content_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=2)
 
-                    # Try to load thumbnail and get duration
+                    # Thumbnail and duration are decoded in the background (see _decode_video_card)
                     video_path = Path(video_info['path'])
-                    thumbnail = None
-                    duration_str = "Unknown"
-
-                    if video_path.exists():
-                        try:
-                            import imageio
-                            reader = imageio.get_reader(str(video_path))
-                            frame = reader.get_data(0)
-
-                            # Get video duration
-                            try:
-                                fps = reader.get_meta_data().get('fps', 30)
-                                frame_count = reader.count_frames()
-                                duration_seconds = frame_count / fps if fps > 0 else 0
-                                minutes = int(duration_seconds // 60)
-                                seconds = int(duration_seconds % 60)
-                                duration_str = f"{minutes}:{seconds:02d}"
-                            except:
-                                # Fallback: try opencv
-                                try:
-                                    import cv2
-                                    cap = cv2.VideoCapture(str(video_path))
-                                    fps = cap.get(cv2.CAP_PROP_FPS)
-                                    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                                    cap.release()
-                                    if fps > 0:
-                                        duration_seconds = frame_count / fps
-                                        minutes = int(duration_seconds // 60)
-                                        seconds = int(duration_seconds % 60)
-                                        duration_str = f"{minutes}:{seconds:02d}"
-                                except:
-                                    pass
-
-                            reader.close()
-
-                            img = Image.fromarray(frame)
-                            # 25% bigger: 150*1.25 = 187.5, 112*1.25 = 140
-                            img.thumbnail((188, 140), Image.Resampling.LANCZOS)
-                            thumbnail = ImageTk.PhotoImage(img)
-                            self.video_thumbnails.append(thumbnail)  # Keep reference
-                        except Exception as e:
-                            print(f"Error loading thumbnail: {e}")
 
                     # Layout: thumbnail on left, info on right
                     content_container.columnconfigure(1, weight=1)
@@ -995,13 +1051,8 @@ class FractalMusicGUI:
                     thumb_container = ttk.Frame(content_container)
                     thumb_container.grid(row=0, column=0, padx=(0, 10), sticky=tk.W)
 
-                    if thumbnail:
-                        thumb_label = ttk.Label(thumb_container, image=thumbnail, text="")
-                        thumb_label.image = thumbnail  # Keep reference
-                        thumb_label.pack()
-                    else:
-                        thumb_label = ttk.Label(thumb_container, text="[No Preview]", width=20, anchor=tk.CENTER)
-                        thumb_label.pack()
+                    thumb_label = ttk.Label(thumb_container, text="[Loading...]", width=20, anchor=tk.CENTER)
+                    thumb_label.pack()
 
                     # Video info (right side, beside thumbnail)
                     from datetime import datetime
@@ -1038,7 +1089,7 @@ class FractalMusicGUI:
                     title_label = ttk.Label(info_frame, text=title, font=('Segoe UI', 12, 'bold'), wraplength=200)
                     title_label.grid(row=0, column=0, sticky=tk.W)
 
-                    duration_label = ttk.Label(info_frame, text=f"Duration: {duration_str}", font=('Segoe UI', 11))
+                    duration_label = ttk.Label(info_frame, text="Duration: Unknown", font=('Segoe UI', 11))
                     duration_label.grid(row=1, column=0, sticky=tk.W)
 
                     fractal_label = ttk.Label(info_frame, text=f"Type: {fractal_display}", font=('Segoe UI', 10), foreground='#666666')
@@ -1078,13 +1129,23 @@ class FractalMusicGUI:
 
                     self.video_list_data.append(video_info)
 
+                    # Decode off the UI thread; check_queue fills in the card when it's done
+                    if video_path.exists():
+                        future = self.thumbnail_executor.submit(self._decode_video_card, video_path)
+                        future.add_done_callback(
+                            lambda f, t=token, th=thumb_label, du=duration_label:
+                                self.message_queue.put(("thumbnail", (t, th, du, f)))
+                        )
+                        self._thumbnail_futures.append(future)
+                    else:
+                        thumb_label.config(text="[No Preview]")
+
                 # Configure column weights for equal spacing
                 for col in range(videos_per_row):
                     self.video_content.columnconfigure(col, weight=1, uniform="video_cols")
 
-                # Update scroll region
-                self.video_content.update_idletasks()
-                self.video_canvas.configure(scrollregion=self.video_canvas.bbox("all"))
+                # Update scroll region once layout has settled, without forcing a synchronous pass
+                self._schedule_scrollregion_refresh()
             else:
                 no_videos_label = ttk.Label(self.video_content, text="No videos available. Generate a video to get started!",
                                            font=('Segoe UI', 10))
@@ -1095,6 +1156,82 @@ class FractalMusicGUI:
             error_label.grid(row=0, column=0, padx=20, pady=20)
             print(f"Error in refresh_video_list: {e}")
 
+    @staticmethod
+    def _decode_video_card(video_path: Path):
+        """Read the first frame and duration of a video for its list card (runs in worker thread).
+
+        Returns (thumbnail PIL image, duration string).
+        """
+        import imageio
+        duration_str = "Unknown"
+        reader = imageio.get_reader(str(video_path))
+        try:
+            frame = reader.get_data(0)
+
+            # Get video duration
+            try:
+                fps = reader.get_meta_data().get('fps', 30)
+                frame_count = reader.count_frames()
+                duration_seconds = frame_count / fps if fps > 0 else 0
+                minutes = int(duration_seconds // 60)
+                seconds = int(duration_seconds % 60)
+                duration_str = f"{minutes}:{seconds:02d}"
+            except:
+                # Fallback: try opencv
+                try:
+                    import cv2
+                    cap = cv2.VideoCapture(str(video_path))
+                    fps = cap.get(cv2.CAP_PROP_FPS)
+                    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                    cap.release()
+                    if fps > 0:
+                        duration_seconds = frame_count / fps
+                        minutes = int(duration_seconds // 60)
+                        seconds = int(duration_seconds % 60)
+                        duration_str = f"{minutes}:{seconds:02d}"
+                except:
+                    pass
+        finally:
+            reader.close()
+
+        img = Image.fromarray(frame)
+        # 25% bigger: 150*1.25 = 187.5, 112*1.25 = 140
+        img.thumbnail((188, 140), Image.Resampling.LANCZOS)
+        return img, duration_str
+
+    def show_video_thumbnail(self, token, thumb_label, duration_label, future):
+        """Fill in a video card from a decoded thumbnail (runs on the Tk main thread via check_queue)."""
+        # Ignore results for a list that has been rebuilt since
+        if token != self._thumbnail_token or future.cancelled() or not thumb_label.winfo_exists():
+            return
+
+        try:
+            img, duration_str = future.result()
+        except Exception as e:
+            print(f"Error loading thumbnail: {e}")
+            thumb_label.config(text="[No Preview]")
+            return
+
+        thumbnail = ImageTk.PhotoImage(img)
+        self.video_thumbnails.append(thumbnail)  # Keep reference
+        thumb_label.config(image=thumbnail, text="", width=0)
+        thumb_label.image = thumbnail  # Keep reference
+        duration_label.config(text=f"Duration: {duration_str}")
+
+        # The card grew from the placeholder size
+        self._schedule_scrollregion_refresh()
+
+    def _schedule_scrollregion_refresh(self):
+        """Recompute the video list scrollregion once the event loop is idle (coalesces thumbnails arriving together)."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after_idle(self._refresh_scrollregion)
+
+    def _refresh_scrollregion(self):
+        """Update the video list canvas scrollregion to fit its content."""
+        self._scroll_pending = False
+        self.video_canvas.configure(scrollregion=self.video_canvas.bbox("all"))
+
     def on_video_select_from_thumb(self, video_info):
         """Handle video selection from thumbnail."""
         self.selected_video = video_info
@@ -1269,7 +1406,7 @@ class FractalMusicGUI:
             self.audio_duration = duration
 
             # Update trim controls max values based on audio duration
-            if hasattr(self, 'trim_start_scale'):
+            if self.trim_start_scale is not None:
                 self.trim_start_scale.config(to=duration)
                 self.trim_end_scale.config(to=duration)
                 # Initialize trim end to min(10 seconds, duration) if it's still at default
@@ -1349,11 +1486,11 @@ class FractalMusicGUI:
     def update_trim_controls(self):
         """Enable/disable trim controls based on checkbox state."""
         state = 'normal' if self.settings['trim_enabled'].get() else 'disabled'
-        if hasattr(self, 'trim_start_scale'):
+        if self.trim_start_scale is not None:
             self.trim_start_scale.config(state=state)
             self.trim_end_scale.config(state=state)
             # Also enable/disable fine adjustment buttons
-            if hasattr(self, 'trim_start_minus_btn'):
+            if self.trim_start_minus_btn is not None:
                 self.trim_start_minus_btn.config(state=state)
                 self.trim_start_plus_btn.config(state=state)
                 self.trim_end_minus_btn.config(state=state)
@@ -1361,7 +1498,7 @@ class FractalMusicGUI:
 
     def update_trim_labels(self):
         """Update trim labels with current values."""
-        if hasattr(self, 'trim_start_label'):
+        if self.trim_start_label is not None:
             start_val = self.settings['trim_start'].get()
             end_val = self.settings['trim_end'].get()
 
@@ -1398,6 +1535,14 @@ class FractalMusicGUI:
             messagebox.showwarning("Warning", "Generation already in progress.")
             return
 
+        # Snapshot settings on the Tk thread; the worker only reads this object.
+        # Done before any state changes so invalid input (e.g. a cleared Spinbox) leaves the GUI usable
+        try:
+            config = GenerationConfig.from_settings(self.settings)
+        except tk.TclError as e:
+            messagebox.showerror("Error", f"Invalid settings value:\n{e}")
+            return
+
         # Ask for video title
         video_title = self.get_video_title()
         if video_title is None:  # User cancelled
@@ -1414,7 +1559,7 @@ class FractalMusicGUI:
         # Start generation in background thread
         self.generation_thread = threading.Thread(
             target=self.generate_video_worker,
-            args=(self.current_audio_path, video_title),
+            args=(self.current_audio_path, config, video_title),
             daemon=True
         )
         self.generation_thread.start()
@@ -1425,7 +1570,7 @@ class FractalMusicGUI:
             self.generation_cancelled = True
             self.message_queue.put(("status", "Stopping generation..."))
 
-    def generate_video_worker(self, audio_path: Path, video_title: str = None):
+    def generate_video_worker(self, audio_path: Path, config: GenerationConfig, video_title: str = None):
         """Worker function that runs in background thread to generate video."""
         try:
             # Check if cancelled before starting
@@ -1436,56 +1581,25 @@ class FractalMusicGUI:
                 
             self.message_queue.put(("status", "Extracting audio features..."))
 
-            # Get settings
-            fps = self.settings['fps'].get()
-            width = self.settings['width'].get()
-            height = self.settings['height'].get()
-            intensity = self.settings['intensity'].get()
-            palette_choice = self.settings['palette'].get()
-            power = self.settings['power'].get()
-            dynamic_dims = self.settings['dynamic_dimensions'].get()
-            dim_factor = self.settings['dimension_factor'].get()
-            use_custom_palette = self.settings['use_custom_palette'].get()
-            quality = self.settings['quality_preset'].get()
-            max_iterations = self.settings['max_iterations'].get()
-            z_real = self.settings['z_real'].get()
-            z_imag = self.settings['z_imag'].get()
-            c_base_real = self.settings['c_base_real'].get()
-            c_base_imag = self.settings['c_base_imag'].get()
-            rotation_enabled = self.settings['rotation_enabled'].get()
+            fps = config.fps
             # Convert rotations per second to radians per frame
-            rotations_per_second = self.settings['rotation_velocity'].get()
-            rotation_velocity = (rotations_per_second * 2 * np.pi) / fps if rotation_enabled else 0.0
+            rotation_velocity = (config.rotation_velocity * 2 * np.pi) / fps if config.rotation_enabled else 0.0
 
             # Get trim settings
-            trim_enabled = self.settings['trim_enabled'].get()
-            trim_start = self.settings['trim_start'].get() if trim_enabled else None
-            trim_end = self.settings['trim_end'].get() if trim_enabled else None
+            trim_enabled = config.trim_enabled
+            trim_start = config.trim_start if trim_enabled else None
+            trim_end = config.trim_end if trim_enabled else None
 
             # Create trimmed audio file if trimming is enabled
             audio_path_for_video = audio_path
             temp_audio_path = None
             if trim_enabled and trim_start is not None and trim_end is not None:
-                import tempfile
-                import subprocess
-                import shutil
-
                 # Create temporary trimmed audio file
                 temp_dir = tempfile.gettempdir()
                 temp_audio_path = Path(temp_dir) / f"trimmed_{audio_path.stem}_{int(trim_start)}_{int(trim_end)}.wav"
 
                 # Use ffmpeg to trim audio
-                ffmpeg_exe = None
-                # Try to get ffmpeg from imageio_ffmpeg
-                try:
-                    import imageio_ffmpeg
-                    ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-                except:
-                    pass
-
-                # Fallback to system ffmpeg
-                if not ffmpeg_exe:
-                    ffmpeg_exe = shutil.which('ffmpeg')
+                ffmpeg_exe = self._ffmpeg_exe
 
                 if ffmpeg_exe:
                     trim_duration = trim_end - trim_start
@@ -1522,57 +1636,42 @@ class FractalMusicGUI:
                 audio_path_for_video = audio_path
 
             # Get normalization setting
-            normalize = self.settings['normalize_audio'].get()
-            
-            # Extract features - use trimmed audio file if available (it already has the correct segment)
-            # Also extract waveform data for direct audio following
-            rms, cent, sr, duration, waveform = extract_features(
-                str(audio_path_for_video),  # Use trimmed audio if available, otherwise original
-                fps=fps,
-                start_time=None,  # Don't trim again - audio_path_for_video is already trimmed if needed
-                end_time=None,
-                return_waveform=True,  # Get waveform data for direct audio following
-                normalize=normalize  # Apply normalization if enabled
-            )
-
-            self.message_queue.put(("status", "Analyzing audio profile..."))
+            normalize = config.normalize_audio
 
             # Get fractal type
-            fractal_type = self.settings['fractal_type'].get()
+            fractal_type = config.fractal_type
 
-            # Get audio profile and select preset (use trimmed audio if available)
+            # Audio profile uses the trimmed audio if available
             audio_for_profile = str(audio_path_for_video) if temp_audio_path else str(audio_path)
-            prof = audio_profile(audio_for_profile, fps=fps, normalize=normalize)
+
+            # Feature extraction and profiling read the same file independently, so run them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Extract features - use trimmed audio file if available (it already has the correct segment)
+                # Also extract waveform data for direct audio following
+                features_future = executor.submit(
+                    extract_features,
+                    str(audio_path_for_video),  # Use trimmed audio if available, otherwise original
+                    fps=fps,
+                    start_time=None,  # Don't trim again - audio_path_for_video is already trimmed if needed
+                    end_time=None,
+                    return_waveform=True,  # Get waveform data for direct audio following
+                    normalize=normalize  # Apply normalization if enabled
+                )
+                profile_future = executor.submit(audio_profile, audio_for_profile, fps=fps, normalize=normalize)
+
+                rms, cent, sr, duration, waveform = features_future.result()
+                self.message_queue.put(("status", "Analyzing audio profile..."))
+                prof = profile_future.result()
 
             if fractal_type == 'julia':
-                preset_name = choose_preset_name(prof) if palette_choice == 'auto' else palette_choice
-                preset = JULIA_PRESETS.get(preset_name, JULIA_PRESETS['ethereal']).copy()
+                preset_name = choose_preset_name(prof) if config.palette == 'auto' else config.palette
+                base_preset = JULIA_PRESETS.get(preset_name, JULIA_PRESETS['ethereal'])
             else:  # ifs
                 # For IFS, use the selected preset or default to barnsley_fern
-                ifs_preset_name = self.settings['ifs_preset'].get()
-                preset = IFS_PRESETS.get(ifs_preset_name, IFS_PRESETS['barnsley_fern']).copy()
+                ifs_preset_name = config.ifs_preset
+                base_preset = IFS_PRESETS.get(ifs_preset_name, IFS_PRESETS['barnsley_fern'])
                 preset_name = ifs_preset_name
 
-            # Apply custom palette if selected
-            if use_custom_palette:
-                # Always set custom colors when custom palette is enabled
-                preset['palette'] = 'custom'
-                preset['custom_main_color'] = self.settings['custom_main_color'].get()
-                preset['custom_accent_color'] = self.settings['custom_accent_color'].get()
-                # Clear any other palette settings
-                if 'palette' in preset and preset['palette'] != 'custom':
-                    pass  # Will be overridden
-            elif palette_choice != 'auto' and palette_choice in PALETTES:
-                preset['palette'] = palette_choice
-                # Clear custom colors when using preset palette
-                preset.pop('custom_main_color', None)
-                preset.pop('custom_accent_color', None)
-
-            # Apply intensity multiplier to amplitudes (only for Julia sets)
-            if fractal_type == 'julia' and 'amp_real' in preset and 'amp_imag' in preset:
-                preset['amp_real'] *= intensity
-                preset['amp_imag'] *= intensity
-
             # Apply quality settings (affects video quality)
             # Use max_iterations from GUI setting (can be overridden by user)
             quality_settings = {
@@ -1581,12 +1680,30 @@ class FractalMusicGUI:
                 'high': {'video_quality': 8},
                 'ultra': {'video_quality': 10},
             }
-            quality_config = quality_settings.get(quality, quality_settings['high'])
-            preset['video_quality'] = quality_config['video_quality']
+            quality_config = quality_settings.get(config.quality_preset, quality_settings['high'])
+
+            # Collect all overrides and merge them into the base preset in one step
+            overrides = {
+                'video_quality': quality_config['video_quality'],
+                'max_iter': config.max_iterations,  # Use max_iterations from GUI (user can override quality preset)
+            }
+
+            # Apply custom palette if selected
+            if config.use_custom_palette:
+                # Always set custom colors when custom palette is enabled
+                overrides['palette'] = 'custom'
+                overrides['custom_main_color'] = config.custom_main_color
+                overrides['custom_accent_color'] = config.custom_accent_color
+            elif config.palette != 'auto' and config.palette in PALETTES:
+                # Base presets never carry custom colors, so only the palette name changes
+                overrides['palette'] = config.palette
+
+            # Apply intensity multiplier to amplitudes (only for Julia sets)
+            if fractal_type == 'julia' and 'amp_real' in base_preset and 'amp_imag' in base_preset:
+                overrides['amp_real'] = base_preset['amp_real'] * config.intensity
+                overrides['amp_imag'] = base_preset['amp_imag'] * config.intensity
 
-            # Use max_iterations from GUI (user can override quality preset)
-            max_iterations = self.settings['max_iterations'].get()
-            preset['max_iter'] = max_iterations
+            preset = {**base_preset, **overrides}
 
             self.message_queue.put(("preset", f"Preset: {preset_name} | Tempo: {prof['tempo']:.1f} BPM"))
 
@@ -1628,42 +1745,37 @@ class FractalMusicGUI:
                     cent=cent,
                     preset=preset,
                     waveform=waveform,  # Pass waveform for direct audio following
-                    width=width,
-                    height=height,
+                    width=config.width,
+                    height=config.height,
                     output_dir=str(video_dir),
                     progress_callback=progress_callback,
-                    power=power,  # Pass power parameter
+                    power=config.power,  # Pass power parameter
                     fps=fps,  # Pass FPS for video
-                    dynamic_dimensions=dynamic_dims,  # Dynamic dimension feature
-                    dimension_factor=dim_factor,  # Dimension growth factor
+                    dynamic_dimensions=config.dynamic_dimensions,  # Dynamic dimension feature
+                    dimension_factor=config.dimension_factor,  # Dimension growth factor
                     audio_path=str(audio_path_for_video),  # Pass trimmed audio if available
-                    z_offset_real=z_real,  # Z offset real part
-                    z_offset_imag=z_imag,  # Z offset imaginary part
-                    c_base_offset_real=c_base_real,  # C base offset real part
-                    c_base_offset_imag=c_base_imag,  # C base offset imaginary part
-                    rotation_enabled=rotation_enabled,  # Enable rotation
+                    z_offset_real=config.z_real,  # Z offset real part
+                    z_offset_imag=config.z_imag,  # Z offset imaginary part
+                    c_base_offset_real=config.c_base_real,  # C base offset real part
+                    c_base_offset_imag=config.c_base_imag,  # C base offset imaginary part
+                    rotation_enabled=config.rotation_enabled,  # Enable rotation
                     rotation_velocity=rotation_velocity,  # Rotation velocity
                     video_filename=video_filename,  # Pass custom video filename
                 )
             else:  # ifs
-                # Get rotation settings for IFS
-                rotation_enabled = self.settings['rotation_enabled'].get()
-                rotations_per_second = self.settings['rotation_velocity'].get()
-                rotation_velocity = (rotations_per_second * 2 * np.pi) / fps if rotation_enabled else 0.0
-
                 output_path = ifs_audio_frames_2d(
                     rms=rms,
                     cent=cent,
                     preset=preset,
                     waveform=waveform,  # Pass waveform for direct audio following
-                    width=width,
-                    height=height,
+                    width=config.width,
+                    height=config.height,
                     output_dir=str(video_dir),
                     progress_callback=progress_callback,
                     fps=fps,
                     audio_path=str(audio_path_for_video),
                     video_filename=video_filename,
-                    rotation_enabled=rotation_enabled,
+                    rotation_enabled=config.rotation_enabled,
                     rotation_velocity=rotation_velocity,
                 )
 
@@ -1685,20 +1797,19 @@ class FractalMusicGUI:
                 output_path = str(video_path)
 
                 # Register video in metadata
-                fractal_type = self.settings['fractal_type'].get()
                 settings_dict = {
                     'fps': fps,
-                    'width': width,
-                    'height': height,
-                    'power': power,
-                    'intensity': intensity,
-                    'palette': palette_choice,
-                    'max_iterations': max_iterations,
+                    'width': config.width,
+                    'height': config.height,
+                    'power': config.power,
+                    'intensity': config.intensity,
+                    'palette': config.palette,
+                    'max_iterations': config.max_iterations,
                     'fractal_type': fractal_type,  # Store fractal type
                 }
                 # Store IFS preset name if IFS is selected
                 if fractal_type == 'ifs':
-                    settings_dict['ifs_preset'] = self.settings['ifs_preset'].get()
+                    settings_dict['ifs_preset'] = config.ifs_preset
                 video_info = register_video(audio_path, video_path, video_title, settings_dict)
 
                 # Clean up temporary trimmed audio file after successful video creation
@@ -1715,8 +1826,7 @@ class FractalMusicGUI:
 
             # Generation complete
             self.message_queue.put(("progress", 100))
-            self.message_queue.put(("done", None))
-            self.message_queue.put(("refresh_videos", None))  # Trigger video list refresh
+            self.message_queue.put(("done_refresh", None))  # Finish and refresh video list in one message
 
         except Exception as e:
             self.message_queue.put(("error", str(e)))
@@ -1744,8 +1854,13 @@ class FractalMusicGUI:
                 elif msg_type == "cancelled":
                     self.message_queue.put(("status", "Generation cancelled"))
                     self.message_queue.put(("done", None))
-                elif msg_type == "refresh_videos":
+                elif msg_type == "done_refresh":
+                    self.is_generating = False
+                    self.generation_cancelled = False  # Reset cancellation flag
+                    self.update_ui_state()
                     self.refresh_video_list()
+                elif msg_type == "thumbnail":
+                    self.show_video_thumbnail(*data)
 
         except queue.Empty:
             pass
@@ -1764,7 +1879,7 @@ class FractalMusicGUI:
     def update_palette_colors(self):
         """Update color buttons to show colors from selected palette."""
         # Check if canvases are initialized
-        if not hasattr(self, 'main_color_canvas') or not hasattr(self, 'accent_color_canvases'):
+        if self.main_color_canvas is None:
             return
 
         palette_name = self.settings['palette'].get()
@@ -1846,13 +1961,25 @@ class FractalMusicGUI:
             else:
                 messagebox.showinfo("No Video", "No videos found for this audio file. Generate a video first.")
 
+    @staticmethod
+    def _fit_size(src_size, max_size):
+        """Largest size that fits inside max_size with src_size's aspect ratio (no upscaling)."""
+        src_w, src_h = src_size
+        scale = min(max_size[0] / src_w, max_size[1] / src_h, 1.0)
+        return max(1, round(src_w * scale)), max(1, round(src_h * scale))
+
+    def _resize_frame(self, img, size, resample):
+        """Resize a video frame (no-op when it already has the target size)."""
+        if img.size == size:
+            return img
+        return img.resize(size, resample)
+
     def open_video_player(self, video_path, audio_path=None):
         """Open embedded video player with controls."""
         try:
             import cv2
         except ImportError:
             # Fallback to system player if opencv not available
-            import subprocess
             import platform
             try:
                 if platform.system() == 'Windows':
@@ -1880,27 +2007,38 @@ class FractalMusicGUI:
         controls_frame = ttk.Frame(player_window, padding="10")
         controls_frame.pack(fill=tk.X)
 
-        self.player_state = {
+        state = {
             'playing': False,
             'position': 0,
-            'total_frames': 0,
-            'cap': None,
+            'total_frames': 0,  # 0 = unknown length, playback then ends at decoder EOF
+            'source': None,  # (read, seek, release) callables, used only by the decoder thread
             'fps': 30,
             'current_frame': None,
             'fullscreen': False,
             'audio_path': None,
             'screen_width': None,
             'screen_height': None,
+            'display_width': None,  # Cached video canvas size, refreshed on <Configure>
+            'display_height': None,
+            'resize_after_id': None,  # Pending debounced resize commit (Tk after id)
+            'wm_state': None,  # Last window manager state ('normal', 'zoomed', ...), to spot maximize
+            'frame_queue': queue.Queue(maxsize=4),  # Frames decoded ahead by the decoder thread
+            'seek_queue': queue.Queue(),  # (seek_gen, frame) requests handled by the decoder thread
+            'seek_gen': 0,  # Bumped on every seek so stale queued frames are dropped
+            'stop_event': threading.Event(),
+            'at_end': False,  # Playback reached the end of the stream; Play restarts from 0
+            'update_after_id': None,  # The single pending update_frame callback (Tk after id)
+            'tk_photo': None,  # Persistent PhotoImage, updated in place with paste()
         }
 
         # Initialize pygame mixer for audio
         try:
             import pygame
             pygame.mixer.init()
-            self.player_state['pygame_available'] = True
+            state['pygame_available'] = True
             # Use provided audio path or try to find audio file
             if audio_path and Path(audio_path).exists():
-                self.player_state['audio_path'] = str(audio_path)
+                state['audio_path'] = str(audio_path)
             else:
                 # Try to find audio file
                 audio_file = video_path.parent.parent.parent / "music" / video_path.stem
@@ -1908,57 +2046,131 @@ class FractalMusicGUI:
                 for ext in ['.wav', '.mp3', '.flac', '.m4a']:
                     potential_audio = audio_file.with_suffix(ext)
                     if potential_audio.exists():
-                        self.player_state['audio_path'] = str(potential_audio)
+                        state['audio_path'] = str(potential_audio)
                         break
         except ImportError:
-            self.player_state['pygame_available'] = False
+            state['pygame_available'] = False
+
+        def open_av_source(container, stream, fps):
+            """PyAV frame source: (read, seek, release) where read() returns (position, RGB image or None)."""
+            frames = container.decode(stream)
+            skip_before = None  # After a seek, drop frames decoded from the keyframe up to the target
+            next_pos = 0
+
+            def read():
+                nonlocal skip_before, next_pos
+                for frame in frames:
+                    pos = int(round(frame.time * fps)) if frame.time is not None else next_pos
+                    if skip_before is not None and pos < skip_before:
+                        continue
+                    skip_before = None
+                    next_pos = pos + 1
+                    # to_image() yields RGB directly, no BGR conversion needed
+                    return pos, frame.to_image()
+                return next_pos, None
+
+            def seek(pos):
+                nonlocal frames, skip_before, next_pos
+                container.seek(int(pos / fps / stream.time_base), stream=stream)
+                frames = container.decode(stream)
+                skip_before = pos
+                next_pos = pos
+
+            return read, seek, container.close
+
+        def open_cv2_source(cap):
+            """OpenCV frame source: (read, seek, release) where read() returns (position, RGB image or None)."""
+            def read():
+                pos = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+                ret, frame = cap.read()
+                if not ret:
+                    return pos, None
+                # PIL's 'BGR' raw decoder swaps channels while copying the frame in,
+                # so conversion and copy are a single pass over the pixels
+                h, w = frame.shape[:2]
+                return pos, Image.frombuffer('RGB', (w, h), frame, 'raw', 'BGR', 0, 1)
+
+            def seek(pos):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
+
+            return read, seek, cap.release
 
         def load_video():
-            cap = cv2.VideoCapture(str(video_path))
-            if not cap.isOpened():
-                messagebox.showerror("Error", "Could not open video file")
-                player_window.destroy()
-                return
-
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-            self.player_state['cap'] = cap
-            self.player_state['fps'] = fps
-            self.player_state['total_frames'] = total_frames
+            source = None
+            if AV_AVAILABLE:
+                try:
+                    container = av.open(str(video_path))
+                    stream = container.streams.video[0]
+                    # Enable FFmpeg frame- and slice-level threading
+                    stream.thread_type = 'AUTO'
+                    fps = float(stream.average_rate or 30)
+                    # Many containers (WebM/MKV, some MP4 muxes) leave the stream frame count
+                    # and duration empty, so fall back to the container duration
+                    total_frames = stream.frames or 0
+                    if not total_frames and stream.duration:
+                        total_frames = int(float(stream.duration * stream.time_base) * fps)
+                    if not total_frames and container.duration:
+                        total_frames = int(container.duration / av.time_base * fps)
+                    width = stream.codec_context.width
+                    height = stream.codec_context.height
+                    source = open_av_source(container, stream, fps)
+                except Exception as e:
+                    print(f"PyAV could not open video, using OpenCV: {e}")
+
+            if source is None:
+                cap = cv2.VideoCapture(str(video_path))
+                if not cap.isOpened():
+                    messagebox.showerror("Error", "Could not open video file")
+                    player_window.destroy()
+                    return
+
+                fps = cap.get(cv2.CAP_PROP_FPS)
+                total_frames = max(0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                source = open_cv2_source(cap)
+
+            state['source'] = source
+            state['fps'] = fps
+            state['total_frames'] = total_frames
 
             # Update window size to video size
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             player_window.geometry(f"{min(width+100, 1200)}x{min(height+150, 800)}")
 
+            # Decode ahead on a dedicated daemon thread (it lives as long as the window,
+            # so it must not hold a shared pool worker); the Tk loop only displays ready frames
+            threading.Thread(target=decode_loop, name="fmv-player-decoder", daemon=True).start()
+
             # Don't start playing automatically - wait for user to press play
-            self.player_state['playing'] = False
-            self.play_pause_btn.config(text="▶ Play")
-            update_frame()
+            state['playing'] = False
+            play_pause_btn.config(text="▶ Play")
+            schedule_update(0, show_once=True)
 
         def play_video():
-            if not self.player_state['playing']:
-                self.player_state['playing'] = True
-                self.play_pause_btn.config(text="⏸ Pause")
+            if not state['playing']:
+                if state['at_end']:
+                    # Finished: start over instead of polling a decoder that has nothing left
+                    seek_video(0)
+                state['playing'] = True
+                play_pause_btn.config(text="⏸ Pause")
                 # Start audio playback only when video starts playing (sync with video)
-                if self.player_state.get('pygame_available') and self.player_state.get('audio_path'):
+                if state.get('pygame_available') and state.get('audio_path'):
                     try:
                         import pygame
-                        pygame.mixer.music.load(self.player_state['audio_path'])
+                        pygame.mixer.music.load(state['audio_path'])
                         # Start audio from current video position (sync with video)
-                        audio_pos = self.player_state['position'] / self.player_state['fps'] if self.player_state['fps'] > 0 else 0
+                        audio_pos = state['position'] / state['fps'] if state['fps'] > 0 else 0
                         pygame.mixer.music.play(start=audio_pos)
                     except Exception as e:
                         print(f"Audio playback error: {e}")
-                update_frame()
+                schedule_update(0)
 
         def pause_video():
-            if self.player_state['playing']:
-                self.player_state['playing'] = False
-                self.play_pause_btn.config(text="▶ Play")
+            if state['playing']:
+                state['playing'] = False
+                play_pause_btn.config(text="▶ Play")
                 # Pause audio if available
-                if self.player_state.get('pygame_available'):
+                if state.get('pygame_available'):
                     try:
                         import pygame
                         pygame.mixer.music.pause()
@@ -1966,122 +2178,208 @@ class FractalMusicGUI:
                         pass
 
         def rewind_video():
-            if self.player_state['cap']:
-                new_pos = max(0, self.player_state['position'] - int(self.player_state['fps'] * 5))  # 5 seconds
-                self.player_state['cap'].set(cv2.CAP_PROP_POS_FRAMES, new_pos)
-                self.player_state['position'] = new_pos
+            if state['source']:
+                new_pos = max(0, state['position'] - int(state['fps'] * 5))  # 5 seconds
                 # Update audio position
-                if self.player_state.get('pygame_available') and self.player_state.get('audio_path'):
+                if state.get('pygame_available') and state.get('audio_path'):
                     try:
                         import pygame
-                        audio_pos = new_pos / self.player_state['fps']
-                        if self.player_state['playing']:
+                        audio_pos = new_pos / state['fps']
+                        if state['playing']:
                             pygame.mixer.music.stop()
-                            pygame.mixer.music.load(self.player_state['audio_path'])
+                            pygame.mixer.music.load(state['audio_path'])
                             pygame.mixer.music.play(start=audio_pos)
                     except Exception:
                         pass
-                # Force frame update
-                ret, frame = self.player_state['cap'].read()
-                if ret:
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    img = Image.fromarray(frame_rgb)
-                    update_video_display(img)
+                # Move the decoder and refresh the displayed frame
+                seek_video(new_pos)
 
         def forward_video():
-            if self.player_state['cap']:
-                new_pos = min(self.player_state['total_frames'] - 1,
-                            self.player_state['position'] + int(self.player_state['fps'] * 5))  # 5 seconds
-                self.player_state['cap'].set(cv2.CAP_PROP_POS_FRAMES, new_pos)
-                self.player_state['position'] = new_pos
+            if state['source']:
+                new_pos = state['position'] + int(state['fps'] * 5)  # 5 seconds
+                if state['total_frames'] > 0:
+                    new_pos = min(state['total_frames'] - 1, new_pos)
                 # Update audio position
-                if self.player_state.get('pygame_available') and self.player_state.get('audio_path'):
+                if state.get('pygame_available') and state.get('audio_path'):
                     try:
                         import pygame
-                        audio_pos = new_pos / self.player_state['fps']
-                        if self.player_state['playing']:
+                        audio_pos = new_pos / state['fps']
+                        if state['playing']:
                             pygame.mixer.music.stop()
-                            pygame.mixer.music.load(self.player_state['audio_path'])
+                            pygame.mixer.music.load(state['audio_path'])
                             pygame.mixer.music.play(start=audio_pos)
                     except Exception:
                         pass
-                # Force frame update
-                ret, frame = self.player_state['cap'].read()
-                if ret:
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    img = Image.fromarray(frame_rgb)
-                    update_video_display(img)
+                # Move the decoder and refresh the displayed frame
+                seek_video(new_pos)
+
+        def on_geom_change(event=None):
+            """Debounce <Configure> during drags: commit the new size only after 150ms without further events."""
+            # Maximize/restore is a single jump, not a drag: apply it right away
+            if player_window.state() != state['wm_state']:
+                commit_resize()
+                return
+            # While dragging, frames keep using the last committed size instead of
+            # being rescaled to every intermediate window size
+            if state['resize_after_id'] is not None:
+                player_window.after_cancel(state['resize_after_id'])
+            state['resize_after_id'] = player_window.after(150, commit_resize)
+
+        def commit_resize():
+            """Refresh cached window/screen sizes (only on geometry changes, not per frame)."""
+            if state['resize_after_id'] is not None:
+                player_window.after_cancel(state['resize_after_id'])
+            state['resize_after_id'] = None
+            state['wm_state'] = player_window.state()
+            display_size = (video_canvas.winfo_width(), video_canvas.winfo_height())
+            changed = display_size != (state['display_width'], state['display_height'])
+            state['display_width'], state['display_height'] = display_size
+            state['screen_width'] = player_window.winfo_screenwidth()
+            state['screen_height'] = player_window.winfo_screenheight()
+            # Redraw at the new size right away (matters when paused)
+            if changed and state.get('current_frame') is not None:
+                update_video_display(state['current_frame'])
 
         def toggle_fullscreen():
             is_fullscreen = player_window.attributes('-fullscreen')
-            self.player_state['fullscreen'] = not is_fullscreen
-            player_window.attributes('-fullscreen', self.player_state['fullscreen'])
-            
-            # Cache screen dimensions when entering fullscreen
-            if self.player_state['fullscreen']:
-                self.player_state['screen_width'] = player_window.winfo_screenwidth()
-                self.player_state['screen_height'] = player_window.winfo_screenheight()
+            state['fullscreen'] = not is_fullscreen
+            player_window.attributes('-fullscreen', state['fullscreen'])
+
+            # Not a drag: let the new geometry settle and commit it now, skipping the debounce
+            player_window.update_idletasks()
+            commit_resize()
 
             # Force update of video display after fullscreen toggle
-            if self.player_state['cap'] and self.player_state.get('current_frame') is not None:
+            if state['source'] and state.get('current_frame') is not None:
                 # Re-display current frame with new sizing
-                update_video_display(self.player_state['current_frame'])
+                update_video_display(state['current_frame'])
+
+        def decode_loop():
+            """Decode frames ahead into frame_queue (runs in a background thread, sole user of the source)."""
+            read_frame, seek_frame, release = state['source']
+            frame_queue = state['frame_queue']
+            seek_queue = state['seek_queue']
+            stop_event = state['stop_event']
+            gen = 0
+            pos = 0
+            at_end = False
+
+            def put_frame(item):
+                while not stop_event.is_set():
+                    try:
+                        frame_queue.put(item, timeout=0.05)
+                        return
+                    except queue.Full:
+                        # A pending seek makes this frame stale, drop it
+                        if not seek_queue.empty():
+                            return
+
+            try:
+                while not stop_event.is_set():
+                    try:
+                        # Wait for a seek at end of stream, otherwise just poll
+                        gen, pos = seek_queue.get(timeout=0.05) if at_end else seek_queue.get_nowait()
+                    except queue.Empty:
+                        if at_end:
+                            continue
+                    else:
+                        try:
+                            seek_frame(pos)
+                            at_end = False
+                        except Exception as e:
+                            print(f"Video seek error: {e}")
+                            at_end = True
+                            put_frame((gen, pos, None))
+                        continue
+
+                    try:
+                        pos, img = read_frame()
+                    except Exception as e:
+                        # A decode error ends playback, like a failed read did before
+                        print(f"Video decode error: {e}")
+                        img = None
+                    if img is None:
+                        at_end = True
+                    put_frame((gen, pos, img))
+            finally:
+                release()
+
+        def seek_video(new_pos):
+            """Ask the decoder thread to jump to new_pos and show the first frame from there."""
+            state['seek_gen'] += 1
+            state['position'] = new_pos
+            state['at_end'] = False
+            state['seek_queue'].put((state['seek_gen'], new_pos))
+            # While playing the update loop picks up the new frames by itself
+            if not state['playing']:
+                schedule_update(0, show_once=True)
+
+        def schedule_update(delay_ms, show_once=False):
+            """(Re)schedule update_frame, keeping at most one pending callback so there is a single update chain."""
+            if state['update_after_id'] is not None:
+                player_window.after_cancel(state['update_after_id'])
+            state['update_after_id'] = player_window.after(delay_ms, lambda: update_frame(show_once))
 
         def update_video_display(img):
             """Update video display with proper sizing for fullscreen/normal mode."""
             # Store original frame before resizing (needed for fullscreen toggle)
-            self.player_state['current_frame'] = img.copy()
+            state['current_frame'] = img
 
-            if self.player_state['fullscreen']:
+            if state['fullscreen']:
                 # Fullscreen: use fast NEAREST resampling (just stretches pixels, no upscaling)
-                # Use cached screen dimensions to avoid expensive calls every frame
-                screen_width = self.player_state.get('screen_width') or player_window.winfo_screenwidth()
-                screen_height = self.player_state.get('screen_height') or player_window.winfo_screenheight()
+                # Use cached screen dimensions to avoid Tcl round-trips every frame
+                screen_width = state['screen_width']
+                screen_height = state['screen_height']
                 # Account for controls height (approximately 60px)
                 available_height = screen_height - 60
                 # Use NEAREST for fastest performance (just pixel stretching, no interpolation)
                 # This is much faster than LANCZOS and perfect for stretching without quality concerns
-                img = img.resize((screen_width, available_height), Image.Resampling.NEAREST)
+                img = self._resize_frame(img, (screen_width, available_height), Image.Resampling.NEAREST)
             else:
-                # Normal mode: fit to window (use thumbnail for aspect-preserving resize)
-                display_width = video_canvas.winfo_width() or 800
-                display_height = video_canvas.winfo_height() or 600
+                # Normal mode: fit to window (aspect-preserving, never upscales)
+                display_width = state['display_width'] or 800
+                display_height = state['display_height'] or 600
                 if display_width > 1 and display_height > 1:
                     # Use BILINEAR for normal mode (faster than LANCZOS, still good quality)
-                    img.thumbnail((display_width, display_height), Image.Resampling.BILINEAR)
-
-            photo = ImageTk.PhotoImage(image=img)
-            video_label.config(image=photo, text="", background='black')
-            video_label.image = photo
-            # Center the image
-            video_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+                    target = self._fit_size(img.size, (display_width, display_height))
+                    img = self._resize_frame(img, target, Image.Resampling.BILINEAR)
+
+            if state['tk_photo'] is None or (state['tk_photo'].width(), state['tk_photo'].height()) != img.size:
+                # Size changed (first frame, resize, fullscreen): create the PhotoImage once
+                state['tk_photo'] = ImageTk.PhotoImage(image=img)
+                video_label.config(image=state['tk_photo'], text="", background='black')
+                video_label.image = state['tk_photo']
+                # Center the image
+                video_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+            else:
+                # Same size: update pixels in place, the label redraws on its own
+                state['tk_photo'].paste(img)
 
-        def update_frame():
-            if not self.player_state['cap']:
+        def update_frame(show_once=False):
+            state['update_after_id'] = None
+            if not state['source'] or state['stop_event'].is_set():
                 return
 
-            # Always update frame position
-            self.player_state['position'] = int(self.player_state['cap'].get(cv2.CAP_PROP_POS_FRAMES))
-
-            # Check if we've reached the end
-            if self.player_state['position'] >= self.player_state['total_frames']:
-                self.player_state['playing'] = False
-                self.play_pause_btn.config(text="▶ Play")
-                # Stop audio
-                if self.player_state.get('pygame_available'):
-                    try:
-                        import pygame
-                        pygame.mixer.music.stop()
-                    except Exception:
-                        pass
+            # Take the next decoded frame, skipping any queued before the latest seek
+            try:
+                while True:
+                    gen, position, img = state['frame_queue'].get_nowait()
+                    if gen == state['seek_gen']:
+                        break
+            except queue.Empty:
+                # Decoder hasn't caught up yet, try again shortly
+                if state['playing'] or show_once:
+                    schedule_update(5, show_once)
                 return
 
-            ret, frame = self.player_state['cap'].read()
-            if not ret:
-                self.player_state['playing'] = False
-                self.play_pause_btn.config(text="▶ Play")
+            # Check if we've reached the end
+            total_frames = state['total_frames']
+            if img is None or (total_frames > 0 and position >= total_frames):
+                state['at_end'] = True
+                state['playing'] = False
+                play_pause_btn.config(text="▶ Play")
                 # Stop audio
-                if self.player_state.get('pygame_available'):
+                if state.get('pygame_available'):
                     try:
                         import pygame
                         pygame.mixer.music.stop()
@@ -2089,38 +2387,43 @@ class FractalMusicGUI:
                         pass
                 return
 
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            img = Image.fromarray(frame_rgb)
+            state['position'] = position
 
             # Update display with proper sizing
             update_video_display(img)
 
             # Continue playing if state is playing
-            if self.player_state['playing']:
-                player_window.after(int(1000 / self.player_state['fps']), update_frame)
+            if state['playing']:
+                schedule_update(int(1000 / state['fps']))
 
         # Control buttons
         ttk.Button(controls_frame, text="⏮ Rewind", command=rewind_video).pack(side=tk.LEFT, padx=5)
-        self.play_pause_btn = ttk.Button(controls_frame, text="⏸ Pause", command=lambda: pause_video() if self.player_state['playing'] else play_video())
-        self.play_pause_btn.pack(side=tk.LEFT, padx=5)
+        play_pause_btn = ttk.Button(controls_frame, text="⏸ Pause", command=lambda: pause_video() if state['playing'] else play_video())
+        play_pause_btn.pack(side=tk.LEFT, padx=5)
         ttk.Button(controls_frame, text="⏭ Forward", command=forward_video).pack(side=tk.LEFT, padx=5)
         ttk.Button(controls_frame, text="⛶ Fullscreen", command=toggle_fullscreen).pack(side=tk.LEFT, padx=5)
 
         def on_close():
             # Stop audio
-            if self.player_state.get('pygame_available'):
+            if state.get('pygame_available'):
                 try:
                     import pygame
                     pygame.mixer.music.stop()
                 except Exception:
                     pass
-            # Release video capture
-            if self.player_state['cap']:
-                self.player_state['cap'].release()
+            # Stop the decoder thread (it releases the video source itself)
+            state['stop_event'].set()
+            for after_key in ('resize_after_id', 'update_after_id'):
+                if state[after_key] is not None:
+                    player_window.after_cancel(state[after_key])
             player_window.destroy()
 
         player_window.protocol("WM_DELETE_WINDOW", on_close)
+        # Also stop the decoder if the window goes away without on_close (e.g. app exit)
+        video_canvas.bind('<Destroy>', lambda e: state['stop_event'].set())
+        commit_resize()
+        player_window.bind('<Configure>', on_geom_change)
+        video_canvas.bind('<Configure>', on_geom_change)
         load_video()
 
 
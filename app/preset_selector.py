@@ -1,38 +1,81 @@
-def choose_preset_name(p: dict) -> str:
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    # Decorador vacío si numba no está disponible
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+    prange = range
+
+# Índice devuelto por _choose_preset_idx -> nombre del preset
+_NAMES = ("energetic", "abstract", "deep_sea", "calm", "mathematical", "ethereal")
+
+# Orden de columnas esperado por choose_preset_names_batch
+_FEATURES = ("energy_mean", "energy_dyn", "energy_spiky", "bright_mean", "bright_std", "tempo")
+
+
+@njit(cache=True)
+def _choose_preset_idx(e, e_dyn, e_spiky, b, b_std, tempo):
     """
-    Heurística simple (explicable) -> un preset.
-    Todos los thresholds asumen features normalizados [0,1].
-    Ajusta con 2-3 audios reales y listo.
+    Núcleo compilado de la heurística: 6 floats -> índice en _NAMES (0..5).
     """
-    e = p["energy_mean"]
-    e_dyn = p["energy_dyn"]
-    e_spiky = p["energy_spiky"]
-    b = p["bright_mean"]
-    b_std = p["bright_std"]
-    tempo = p["tempo"]
-
     # 1) Energetic: por TEMPO alto o energía alta + picos
     #    (esto garantiza que electronic caiga en energetic)
     if (tempo >= 138) or (tempo >= 128 and e >= 0.50) or (e > 0.62 and (e_spiky > 0.08 or tempo > 120)):
-        return "energetic"
+        return 0
 
     # 2) Brillante + cambiante = abstract (más “neón”, más movimiento visual)
     if (b > 0.57 and (b_std > 0.18 or e_dyn > 0.28)):
-        return "abstract"
+        return 1
 
     # 3) Oscuro + estable = deep_sea (sensación “abismo”)
     if (b < 0.38 and e < 0.52):
-        return "deep_sea"
+        return 2
 
     # 4) Calm vs Ethereal: aquí es donde decidimos tu "acoustic"
     #    Calm si NO es spiky y NO es muy dinámico; si no, ethereal.
     #    (relajamos e_dyn, porque en tus audios está muy alto)
     if (0.40 <= b <= 0.62) and (e_spiky < 0.055) and (e_dyn < 0.55):
-        return "calm"
+        return 3
 
     # 5) Armónico / “glow matemático”: brillo medio-bajo, poca varianza
     if (b < 0.55 and b_std < 0.14 and e_dyn < 0.22):
-        return "mathematical"
+        return 4
 
     # 6) Caso general “bonito” cuando no cae en lo demás
-    return "ethereal"
+    return 5
+
+
+@njit(parallel=True, cache=True)
+def _choose_preset_idx_batch(profiles):
+    n = profiles.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        out[i] = _choose_preset_idx(profiles[i, 0], profiles[i, 1], profiles[i, 2],
+                                    profiles[i, 3], profiles[i, 4], profiles[i, 5])
+    return out
+
+
+def choose_preset_name(p: dict) -> str:
+    """
+    Heurística simple (explicable) -> un preset.
+    Todos los thresholds asumen features normalizados [0,1].
+    Ajusta con 2-3 audios reales y listo.
+    """
+    return _NAMES[_choose_preset_idx(*(float(p[k]) for k in _FEATURES))]
+
+
+def choose_preset_names_batch(profiles: np.ndarray) -> np.ndarray:
+    """
+    Versión por lotes: profiles es (N, 6) con columnas en el orden de _FEATURES
+    (p. ej. features por ventana de una misma canción). Devuelve índices en _NAMES.
+    """
+    profiles = np.ascontiguousarray(profiles, dtype=np.float64)
+    if profiles.ndim != 2 or profiles.shape[1] != len(_FEATURES):
+        raise ValueError(f"profiles debe ser (N, {len(_FEATURES)}), recibido {profiles.shape}")
+    return _choose_preset_idx_batch(profiles)
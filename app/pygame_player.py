@@ -1,8 +1,14 @@
+import io
+import json
 import os
 import sys
 import time
 from pathlib import Path
+import numpy as np
 import pygame
+from PIL import Image
+
+import _executor
 
 
 # =========================
@@ -15,6 +21,10 @@ FRAMES_ROOT = APP_ROOT / "assets" / "output" / "frames"
 
 WINDOW_W, WINDOW_H = 800, 600
 TARGET_FPS = 60  # Debe coincidir con fps usado para generar frames
+PREFETCH_AHEAD = 8  # Cuántos frames se decodifican por adelantado en segundo plano
+ATLAS_FILE = "frames.rgb"  # Todos los frames en RGB crudo, forma (N, H, W, 3)
+ATLAS_META = "frames.meta.json"  # N, H, W del atlas
+ATLAS_MAX_BYTES = 2 * 1024**3  # Arriba de esto no se crea atlas y se reproducen los PNG
 
 
 # ==========================================
@@ -29,19 +39,40 @@ def list_audio_files(music_dir: Path) -> list[Path]:
     if not music_dir.exists():
         return []
 
-    exts = {".wav", ".mp3"}  # puedes limitar a {".wav"} si quieres
-    files = [p for p in music_dir.iterdir() if p.is_file() and p.suffix.lower() in exts]
+    exts = (".wav", ".mp3")  # puedes limitar a (".wav",) si quieres
+    # os.scandir trae el tipo de archivo en la misma lectura del directorio:
+    # is_file() solo hace stat() para symlinks (que se siguen, como Path.is_file())
+    with os.scandir(music_dir) as it:
+        files = [Path(e.path) for e in it
+                 if e.is_file() and e.name.lower().endswith(exts)]
     files.sort(key=lambda p: p.name.lower())
     return files
 
 
+# Cache de count_frames: str(dir) -> (st_mtime_ns, n_frames)
+_frame_count_cache: dict[str, tuple[int, int]] = {}
+
+
 def count_frames(frames_dir: Path) -> int:
     """
     Cuenta cuántos frames existen con el patrón frame_XXXX.png
+    Usa os.scandir (sin stat() por archivo) y memoriza el resultado mientras
+    el mtime de la carpeta no cambie.
     """
-    if not frames_dir.exists():
+    try:
+        mtime = os.stat(frames_dir).st_mtime_ns
+    except OSError:
         return 0
-    return len(list(frames_dir.glob("frame_*.png")))
+
+    key = str(frames_dir)
+    cached = _frame_count_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(frames_dir) as it:
+        n = sum(1 for e in it if e.name.startswith("frame_") and e.name.endswith(".png"))
+    _frame_count_cache[key] = (mtime, n)
+    return n
 
 
 def frame_path(frames_dir: Path, idx: int) -> Path:
@@ -51,6 +82,122 @@ def frame_path(frames_dir: Path, idx: int) -> Path:
     return frames_dir / f"frame_{idx:04d}.png"
 
 
+def preprocess_frames(frames_dir: Path, target: tuple = (WINDOW_W, WINDOW_H)) -> Path:
+    """
+    Deja los frames al tamaño de la ventana para que el player solo haga blit.
+    Si ya miden target (caso normal), regresa frames_dir tal cual.
+    Si no, los reescala (Lanczos) a una carpeta cache .scaled_800x600 dentro de
+    frames_dir, sin tocar los PNG originales. Un frame solo se vuelve a escalar
+    si el original es más nuevo que su copia en cache (p. ej. tras re-renderizar).
+    Regresa la carpeta desde la que hay que reproducir.
+    """
+    with os.scandir(frames_dir) as it:
+        frames = sorted((e for e in it if e.name.startswith("frame_") and e.name.endswith(".png")),
+                        key=lambda e: e.name)
+    if not frames:
+        return frames_dir
+
+    # Un render produce frames del mismo tamaño: basta con leer el header del primero y el último
+    sizes = set()
+    for e in (frames[0], frames[-1]):
+        with Image.open(e.path) as img:
+            sizes.add(img.size)
+    if sizes == {tuple(target)}:
+        return frames_dir
+
+    cache_dir = frames_dir / f".scaled_{target[0]}x{target[1]}"
+    cache_dir.mkdir(exist_ok=True)
+    with os.scandir(cache_dir) as it:
+        cached = {e.name: e.stat().st_mtime_ns for e in it
+                  if e.name.startswith("frame_") and e.name.endswith(".png")}
+
+    for e in frames:
+        cached_mtime = cached.pop(e.name, None)
+        if cached_mtime is not None and cached_mtime >= e.stat().st_mtime_ns:
+            continue
+        with Image.open(e.path) as img:
+            scaled = img if img.size == tuple(target) else img.resize(target, Image.Resampling.LANCZOS)
+            scaled.save(cache_dir / e.name)
+
+    # Frames que ya no existen en el render actual
+    for name in cached:
+        (cache_dir / name).unlink()
+
+    return cache_dir
+
+
+def build_atlas(frames_dir: Path) -> dict:
+    """
+    Junta todos los frame_*.png en un solo archivo RGB crudo (frames.rgb) para
+    reproducirlo con np.memmap: cero decodificación PNG y cero open() por frame.
+    Se reutiliza solo si coinciden N, el mtime del frame más nuevo y el tamaño
+    de frame (re-renderizar con otra paleta reescribe los PNG con los mismos nombres).
+    Atlas y meta se escriben a .tmp y se publican con os.replace, así un build
+    interrumpido nunca deja un frames.rgb truncado junto a un meta válido.
+    Lanza ValueError si el atlas pasaría de ATLAS_MAX_BYTES.
+    Regresa el meta {"n", "h", "w", "mtime"}.
+    """
+    meta_path = frames_dir / ATLAS_META
+    atlas_path = frames_dir / ATLAS_FILE
+    with os.scandir(frames_dir) as it:
+        mtimes = [e.stat().st_mtime_ns for e in it
+                  if e.name.startswith("frame_") and e.name.endswith(".png")]
+    n = len(mtimes)
+    newest = max(mtimes, default=0)
+    with Image.open(frame_path(frames_dir, 0)) as img:
+        w, h = img.size
+
+    if meta_path.exists() and atlas_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if (meta.get("n") == n and meta.get("mtime") == newest
+                and (meta.get("w"), meta.get("h")) == (w, h)
+                and atlas_path.stat().st_size == n * h * w * 3):
+            return meta
+
+    # Un render largo da decenas de GB en crudo: ahí no vale la pena construirlo
+    # (ni esperar a que termine antes de abrir la ventana)
+    if n * h * w * 3 > ATLAS_MAX_BYTES:
+        raise ValueError(f"el atlas ocuparía {n * h * w * 3 / 2**30:.1f} GB")
+
+    print(f"Creando atlas de {n} frames en {frames_dir} (solo la primera vez)...")
+    atlas_tmp = atlas_path.with_name(ATLAS_FILE + ".tmp")
+    try:
+        with open(atlas_tmp, "wb") as f:
+            for i in range(n):
+                with Image.open(frame_path(frames_dir, i)) as img:
+                    img = img.convert("RGB")
+                    if img.size != (w, h):
+                        raise ValueError(f"Frame {i} mide {img.size}, se esperaba {(w, h)}")
+                    f.write(img.tobytes())
+        os.replace(atlas_tmp, atlas_path)
+    except BaseException:
+        # Un build a medias (tamaños mezclados, disco lleno, Ctrl+C) no debe dejar GBs de basura
+        atlas_tmp.unlink(missing_ok=True)
+        raise
+
+    meta = {"n": n, "h": h, "w": w, "mtime": newest}
+    meta_tmp = meta_path.with_name(ATLAS_META + ".tmp")
+    meta_tmp.write_text(json.dumps(meta))
+    os.replace(meta_tmp, meta_path)
+    return meta
+
+
+def load_frame(fp: str):
+    """
+    Decodifica un PNG sin convertirlo (seguro en un hilo del prefetcher).
+    .convert() necesita el display, así que se hace en el hilo principal.
+    Lee el archivo de un jalón (un solo open/read/close, sin exists() aparte)
+    y SDL_image decodifica desde memoria vía BytesIO.
+    Regresa None si el frame no existe.
+    """
+    try:
+        with open(fp, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return pygame.image.load(io.BytesIO(data), "frame.png")
+
+
 # ==========================================
 # 3) Selector de audio (consola)
 # ==========================================
@@ -103,6 +250,25 @@ def run_player(audio_path: Path, frames_dir: Path, fps: int = TARGET_FPS) -> Non
             "Genera frames primero (tu pipeline de Julia) y vuelve a intentar."
         )
 
+    # Frames ya al tamaño de la ventana: el loop solo hace blit
+    # (si hubo que escalar, se reproduce desde la carpeta cache)
+    try:
+        frames_dir = preprocess_frames(frames_dir)
+    except OSError as e:
+        # Carpeta sin permiso de escritura o PNG ilegible: se reproducen los originales
+        # y el loop los escala con smoothscale
+        print(f"Aviso: no se pudieron pre-escalar los frames ({e}). Usando los originales.")
+
+    # Atlas RGB memory-mapped; si no se puede crear, se usan los PNG con prefetch
+    atlas = None
+    try:
+        meta = build_atlas(frames_dir)
+        atlas = np.memmap(frames_dir / ATLAS_FILE, dtype=np.uint8, mode="r",
+                          shape=(meta["n"], meta["h"], meta["w"], 3))
+        atlas_size = (meta["w"], meta["h"])
+    except (OSError, ValueError) as e:
+        print(f"Aviso: no se pudo crear el atlas de frames ({e}). Usando PNGs.")
+
     # --- Inicializar pygame ---
     pygame.init()
 
@@ -115,22 +281,35 @@ def run_player(audio_path: Path, frames_dir: Path, fps: int = TARGET_FPS) -> Non
 
     clock = pygame.time.Clock()
 
+    # Surface persistente para el atlas: cada frame se copia encima (sin alloc por frame)
+    frame_surface = pygame.Surface(atlas_size).convert() if atlas is not None else None
+
     # --- Cargar audio y empezar ---
     pygame.mixer.music.load(str(audio_path))
     pygame.mixer.music.play()
 
-    # Para sincronización, usaremos "tiempo desde que le dimos play".
-    # Esto evita depender demasiado de get_pos() (que puede variar por backend).
-    start_time = time.perf_counter()
-
+    # Para sincronización usamos el cursor del mixer: get_pos() da los ms
+    # reproducidos desde play() SIN contar pausas, así que no hay que llevar
+    # la cuenta de tiempo pausado a mano.
     paused = False
-    pause_accum = 0.0  # total de tiempo pausado
-    pause_start = None
 
     # Cache simple del último frame (evita recargar si no cambió)
     last_idx = -1
     last_surface = None
 
+    # Prefetch: decodifica los siguientes frames en el pool compartido mientras se muestra el actual
+    executor = _executor.EXEC
+    pending = {}  # idx -> Future[Surface | None]
+
+    # Prefijo de ruta precalculado: en el loop solo se formatea el entero
+    # (concatenar str es más barato que Path / f"frame_{idx:04d}.png" a 60 Hz)
+    frame_prefix = str(frames_dir) + os.sep + "frame_"
+
+    def prefetch(start: int) -> None:
+        for j in range(start + 1, min(start + 1 + PREFETCH_AHEAD, n_frames)):
+            if j not in pending:
+                pending[j] = executor.submit(load_frame, f"{frame_prefix}{j:04d}.png")
+
     running = True
     while running:
         # =========================
@@ -148,34 +327,27 @@ def run_player(audio_path: Path, frames_dir: Path, fps: int = TARGET_FPS) -> Non
                 if event.key == pygame.K_SPACE:
                     if not paused:
                         pygame.mixer.music.pause()
-                        paused = True
-                        pause_start = time.perf_counter()
                     else:
                         pygame.mixer.music.unpause()
-                        paused = False
-                        if pause_start is not None:
-                            pause_accum += time.perf_counter() - pause_start
-                            pause_start = None
+                    paused = not paused
 
                 # R = reiniciar
                 if event.key == pygame.K_r:
                     pygame.mixer.music.stop()
                     pygame.mixer.music.play()
-                    start_time = time.perf_counter()
                     paused = False
-                    pause_accum = 0.0
-                    pause_start = None
                     last_idx = -1
                     last_surface = None
 
         # =========================
         # 4.2) Calcular tiempo audio
         # =========================
-        if paused:
-            # Si está pausado, congelamos el tiempo "lógico"
-            audio_time = (pause_start - start_time - pause_accum) if pause_start else 0.0
-        else:
-            audio_time = time.perf_counter() - start_time - pause_accum
+        pos_ms = pygame.mixer.music.get_pos()
+        if pos_ms < 0:
+            # -1 = el mixer ya no está reproduciendo (el audio terminó)
+            running = False
+            continue
+        audio_time = pos_ms / 1000.0
 
         # Convertimos a índice de frame
         idx = int(audio_time * fps)
@@ -185,20 +357,44 @@ def run_player(audio_path: Path, frames_dir: Path, fps: int = TARGET_FPS) -> Non
             running = False
             continue
 
+        # Mismo frame que el ya mostrado (pausa o aún no llega el siguiente):
+        # no redibujar ni hacer flip, solo dormir hasta el siguiente frame.
+        # Los eventos se siguen atendiendo al inicio del loop.
+        if idx == last_idx and last_surface is not None:
+            sleep_s = (last_idx + 1) / fps - audio_time
+            time.sleep(max(0.0, min(sleep_s, 1.0 / fps) - 0.001))
+            continue
+
         # =========================
         # 4.3) Cargar y dibujar frame
         # =========================
         if idx != last_idx:
-            fp = frame_path(frames_dir, idx)
-            if fp.exists():
-                img = pygame.image.load(str(fp))
-                # Convert para blit rápido y asegurar formato display
-                img = img.convert()
-                # Escalar si hace falta (si tu frame ya es 800x600, esto es 1:1)
-                if img.get_width() != WINDOW_W or img.get_height() != WINDOW_H:
-                    img = pygame.transform.smoothscale(img, (WINDOW_W, WINDOW_H))
-                last_surface = img
+            if atlas is not None:
+                # Lectura directa del memmap (page cache), sin decodificar.
+                # surfarray es (W, H, 3), por eso swapaxes
+                pygame.surfarray.blit_array(frame_surface, atlas[idx].swapaxes(0, 1))
+                # Red de seguridad: el atlas debería venir ya a WINDOW_W x WINDOW_H
+                last_surface = (frame_surface if atlas_size == (WINDOW_W, WINDOW_H)
+                                else pygame.transform.smoothscale(frame_surface, (WINDOW_W, WINDOW_H)))
                 last_idx = idx
+            else:
+                # Usa el frame ya precargado si existe; si no, lo carga aquí mismo
+                fut = pending.pop(idx, None)
+                img = fut.result() if fut is not None else load_frame(f"{frame_prefix}{idx:04d}.png")
+                if img is not None:
+                    # Convert para blit rápido y asegurar formato display
+                    img = img.convert()
+                    # Normalmente ya viene a WINDOW_W x WINDOW_H gracias a preprocess_frames;
+                    # si no (frames de otro tamaño mezclados), se escala aquí
+                    if img.get_width() != WINDOW_W or img.get_height() != WINDOW_H:
+                        img = pygame.transform.smoothscale(img, (WINDOW_W, WINDOW_H))
+                    last_surface = img
+                    last_idx = idx
+
+                # Descarta precargas que ya quedaron atrás
+                for j in [j for j in pending if j < idx - 2]:
+                    pending.pop(j).cancel()
+                prefetch(idx)
 
         if last_surface is not None:
             screen.blit(last_surface, (0, 0))
@@ -214,6 +410,9 @@ def run_player(audio_path: Path, frames_dir: Path, fps: int = TARGET_FPS) -> Non
         clock.tick(fps)
 
     # --- Limpieza ---
+    # El pool es compartido: solo se cancelan las precargas propias
+    for fut in pending.values():
+        fut.cancel()
     pygame.mixer.music.stop()
     pygame.quit()
 
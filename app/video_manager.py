@@ -1,150 +1,398 @@
 """
 Video management system for storing and retrieving multiple videos per audio file.
 All paths are stored as relative paths to ensure portability across systems.
+
+Metadata is kept in an append-only NDJSON log: registering a video appends a
+'put' record and deleting one appends a 'del' tombstone, so each change is a
+single line write. The log is compacted back to one record per live video when
+it grows past twice the number of live entries; compaction runs on the shared
+background executor so callers never wait for the rewrite.
 """
 
+import functools
 import json
+import operator
 import os
+import re
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
 
+import _executor
+
+# orjson (optional): much faster parse/serialize, works directly on bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get app root directory (where this file is located)
 APP_ROOT = Path(__file__).resolve().parent
 VIDEOS_ROOT = APP_ROOT / "assets" / "output" / "videos"
 MUSIC_ROOT = APP_ROOT / "assets" / "music"
-METADATA_FILE = VIDEOS_ROOT / "metadata.json"
+METADATA_FILE = VIDEOS_ROOT / "metadata.ndjson"
+
+# String forms of the roots, computed once for the hot path helpers
+_APP_ROOT_STR = str(APP_ROOT)
+_VIDEOS_ROOT_STR = str(VIDEOS_ROOT)
+_MUSIC_ROOT_STR = str(MUSIC_ROOT)
+
+# Runs of characters not allowed in a video title filename. Keeps exactly what
+# `c.isalnum() or c in ' -_'` keeps: for str patterns \w is the same isalnum() test plus '_'
+_TITLE_RE = re.compile(r'[^\w \-]+')
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+
+# Root directories as "dir/" strings, in the order _to_relative_path tries them
+_ROOT_PREFIXES = tuple(os.path.join(root, '') for root in (_APP_ROOT_STR, _VIDEOS_ROOT_STR, _MUSIC_ROOT_STR))
+LEGACY_METADATA_FILE = VIDEOS_ROOT / "metadata.json"
+
+# Written as the first line of every snapshot. Version 1: all stored paths are relative,
+# so logs at this version need no path migration when loaded.
+CURRENT_SCHEMA = 1
+
+# Logs larger than this are compacted as soon as they hold any dead record
+COMPACT_LOG_BYTES = 1024 * 1024
+
+# Above this size, per-audio lookups stream the log instead of replaying all of it
+STREAM_LOAD_BYTES = 4 * 1024 * 1024
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one log record as a newline-terminated UTF-8 line."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+def _loads(data):
+    """Parse JSON from bytes/str (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Serializes appends with background compaction so no record is written to a file about to be replaced
+_LOG_LOCK = threading.RLock()
+
+# In-process copy of the replayed log: ((st_mtime_ns, st_size), metadata).
+# Our own appends/snapshots replace it with an updated copy (readers may hold the old one,
+# so a published dict and its lists are never mutated); any other change to the file invalidates it.
+_META_CACHE = None
+
+# (cache key, {(audio_stem, id): video_info}) built from _META_CACHE for O(1) lookups by id
+_ID_INDEX = None
 
 def ensure_video_directories():
     """Ensure video storage directories exist."""
     VIDEOS_ROOT.mkdir(parents=True, exist_ok=True)
     if not METADATA_FILE.exists():
-        with open(METADATA_FILE, 'w') as f:
-            json.dump({}, f)
+        with _LOG_LOCK:
+            if METADATA_FILE.exists():
+                return
+            legacy = {}
+            if LEGACY_METADATA_FILE.exists():
+                # One-time import of the old dict-of-lists metadata.json
+                try:
+                    legacy = _loads(LEGACY_METADATA_FILE.read_bytes())
+                except (json.JSONDecodeError, IOError):
+                    legacy = {}
+                _normalize_in_place(legacy)
+            _write_snapshot(legacy)
 
 def _to_relative_path(path: Path) -> str:
     """Convert absolute path to relative path from app root."""
+    if not path:
+        return ""
+    path = os.fspath(path)
+    # Stored paths are already relative with forward slashes: pass them through untouched
+    if '\\' not in path and not os.path.isabs(path):
+        return path
+    return _to_relative_path_str(path)
+
+@functools.lru_cache(maxsize=4096)
+def _to_relative_path_str(path: str) -> str:
+    """Cached worker for _to_relative_path (pure string -> string mapping)."""
+    norm = os.path.normpath(path)
+    if os.path.isabs(norm):
+        # Try app root, then videos root, then music root (plain prefix checks, no Path objects)
+        for prefix in _ROOT_PREFIXES:
+            if norm.startswith(prefix):
+                return norm[len(prefix):].replace('\\', '/')  # Use forward slashes for portability
+        # Fallback: store just the filename
+        return os.path.basename(norm)
+    # Already relative, normalize separators
+    return norm.replace('\\', '/')
+
+def _paths_cache_clear():
+    """Drop cached path conversions (e.g. after the app roots change)."""
+    _to_relative_path_str.cache_clear()
+
+# Libraries larger than this list their video folders concurrently
+PARALLEL_LISTING_MIN_ENTRIES = 32
+
+def _list_files(parent: str) -> set:
+    """
+    Names of the files in a directory (empty if it doesn't exist).
+    Other errors (EACCES, EIO, a network timeout) propagate like they did from
+    Path.exists(): an unreadable folder must not make its videos look deleted.
+    """
     try:
-        if not path:
-            return ""
+        with os.scandir(parent) as it:
+            return {e.name for e in it if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
 
-        path_obj = Path(path) if isinstance(path, str) else path
-        if path_obj.is_absolute():
-            # Try to make it relative to app root
-            try:
-                rel = path_obj.relative_to(APP_ROOT)
-                return str(rel).replace('\\', '/')  # Use forward slashes for portability
-            except ValueError:
-                # If not under app root, try relative to videos root
-                try:
-                    rel = path_obj.relative_to(VIDEOS_ROOT)
-                    return str(rel).replace('\\', '/')
-                except ValueError:
-                    # Try relative to music root
-                    try:
-                        rel = path_obj.relative_to(MUSIC_ROOT)
-                        return str(rel).replace('\\', '/')
-                    except ValueError:
-                        # Fallback: store just the filename
-                        return path_obj.name
-        # Already relative, normalize separators
-        return str(path_obj).replace('\\', '/')
-    except Exception:
-        return str(path) if path else ""
-
-def _to_absolute_path(rel_path: str) -> Path:
+def _make_exists_checker(prefetch_dirs=()):
+    """
+    Return an exists(path) callable that lists each parent directory once
+    with os.scandir instead of issuing one stat() per path.
+    prefetch_dirs are listed up front, concurrently on the shared executor,
+    which overlaps the latency of slow (e.g. network) filesystems.
+    """
+    listings = {}
+    prefetch_dirs = list(set(prefetch_dirs))
+    if len(prefetch_dirs) > 1:
+        listings.update(zip(prefetch_dirs, _executor.EXEC.map(_list_files, prefetch_dirs)))
+
+    def exists(path) -> bool:
+        parent, name = os.path.split(os.fspath(path))
+        names = listings.get(parent)
+        if names is None:
+            names = listings[parent] = _list_files(parent)
+        return name in names
+
+    return exists
+
+def _to_absolute_path(rel_path: str, exists=os.path.exists) -> Path:
     """Convert relative path to absolute path."""
     if not rel_path:
         return Path()
 
     # Normalize path separators (handle both / and \)
-    rel_path_normalized = str(rel_path).replace('\\', '/')
-    rel_path_obj = Path(rel_path_normalized)
-
-    if rel_path_obj.is_absolute():
-        # If it's already absolute, check if it exists
-        # If not, try to convert it to relative first
-        if not rel_path_obj.exists():
-            # Try to make it relative and then absolute again
-            try:
-                rel = rel_path_obj.relative_to(APP_ROOT)
-                return APP_ROOT / rel
-            except ValueError:
-                pass
-        return rel_path_obj
-
-    # Try relative to app root first (most common case)
-    abs_path = APP_ROOT / rel_path_obj
-    if abs_path.exists():
-        return abs_path
-
-    # Try relative to videos root
-    abs_path = VIDEOS_ROOT / rel_path_obj
-    if abs_path.exists():
-        return abs_path
-
-    # Try relative to music root
-    abs_path = MUSIC_ROOT / rel_path_obj
-    if abs_path.exists():
-        return abs_path
+    rel_path_normalized = os.fspath(rel_path).replace('\\', '/')
+
+    if os.path.isabs(rel_path_normalized):
+        # Already absolute, use as-is
+        return Path(rel_path_normalized)
+
+    # Try relative to app root first (most common case), then videos root, then music root.
+    # Candidates are plain strings; a Path is only built for the result.
+    for root in (_APP_ROOT_STR, _VIDEOS_ROOT_STR, _MUSIC_ROOT_STR):
+        abs_path = os.path.join(root, rel_path_normalized)
+        if exists(abs_path):
+            return Path(abs_path)
 
     # If path doesn't start with .., assume it's relative to app root
-    if not any(part == '..' for part in rel_path_obj.parts):
-        return APP_ROOT / rel_path_obj
+    if '..' not in rel_path_normalized.split('/'):
+        return Path(_APP_ROOT_STR, rel_path_normalized)
 
     # Return as-is (might be relative to current working directory)
-    return rel_path_obj.resolve() if rel_path_obj.exists() else (APP_ROOT / rel_path_obj)
+    return Path(rel_path_normalized).resolve() if exists(rel_path_normalized) else Path(_APP_ROOT_STR, rel_path_normalized)
+
+def _apply_record(metadata: Dict, rec: Dict):
+    """Apply one log record ('put' or 'del' tombstone) to the metadata dict."""
+    audio_stem = rec.get('audio_stem')
+    op = rec.get('op')
+    if op == 'put':
+        metadata.setdefault(audio_stem, []).append(rec['video'])
+    elif op == 'del':
+        videos = [v for v in metadata.get(audio_stem, ()) if v.get('id') != rec.get('id')]
+        if videos:
+            metadata[audio_stem] = videos
+        else:
+            metadata.pop(audio_stem, None)
+
+def append_record(rec: Dict):
+    """Append a single record to the metadata log (O(1) instead of rewriting the file)."""
+    append_records([rec])
+
+def append_records(recs: List[Dict]):
+    """Append several records to the metadata log with a single write."""
+    global _META_CACHE
+    ensure_video_directories()
+    line = b''.join(_dumps_line(rec) for rec in recs)
+    with _LOG_LOCK, open(METADATA_FILE, 'a+b') as f:
+        key_before = _stat_key(f.fileno())
+        # Start on a fresh line if an interrupted write left a partial one
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                line = b'\n' + line
+        f.write(line)
+        f.flush()
+        # Keep the cache current instead of re-parsing the whole log on the next load.
+        # Copy-on-write: copy the dict and the lists of the stems touched, then swap it in
+        if _META_CACHE is not None and _META_CACHE[0] == key_before:
+            metadata = dict(_META_CACHE[1])
+            for audio_stem in {rec.get('audio_stem') for rec in recs}:
+                if audio_stem in metadata:
+                    metadata[audio_stem] = list(metadata[audio_stem])
+            for rec in recs:
+                _apply_record(metadata, rec)
+            _META_CACHE = (_stat_key(f.fileno()), metadata)
+
+def _stat_key(fd=None):
+    """Cache key for the metadata log: (st_mtime_ns, st_size)."""
+    st = os.fstat(fd) if fd is not None else os.stat(METADATA_FILE)
+    return st.st_mtime_ns, st.st_size
+
+def _read_log():
+    """Replay the metadata log. Returns (metadata, record_count, torn, schema_version)."""
+    metadata = {}
+    record_count = 0
+    torn = False
+    schema = 0
+    with open(METADATA_FILE, 'rb') as f:
+        for line in f:
+            try:
+                rec = _loads(line)
+            except json.JSONDecodeError:
+                # Partial line left by an interrupted write; compaction drops it
+                torn = True
+                record_count += 1
+                continue
+            if rec.get('op') == 'schema':
+                schema = rec.get('version', 0)
+                continue
+            record_count += 1
+            _apply_record(metadata, rec)
+    return metadata, record_count, torn, schema
+
+def _normalize_in_place(metadata: Dict) -> bool:
+    """Make every stored path relative in a single walk. Returns True iff any field was rewritten."""
+    changed = False
+    for videos in metadata.values():
+        for video_info in videos:
+            for field in ('path', 'audio_file'):
+                old = video_info.get(field)
+                if old:
+                    new = _to_relative_path(old)
+                    if new != old:
+                        video_info[field] = new
+                        changed = True
+    return changed
 
 def load_metadata() -> Dict:
-    """Load video metadata from JSON file and migrate absolute paths to relative."""
+    """Return {audio_stem: [video_info, ...]} replayed from the NDJSON log (a copy of the cached state)."""
+    _, metadata = _cached_metadata()
+    # Callers add/remove entries in place; copy the per-audio lists so the cached dict stays intact
+    return {audio_stem: list(videos) for audio_stem, videos in metadata.items()}
+
+def _cached_metadata():
+    """Return the shared (key, metadata) cache entry, re-parsing the log if it changed. Do not mutate."""
+    global _META_CACHE
     ensure_video_directories()
-    if not METADATA_FILE.exists():
-        return {}
     try:
-        with open(METADATA_FILE, 'r') as f:
-            metadata = json.load(f)
-
-        # Migrate absolute paths to relative paths
-        migrated = False
-        for audio_stem, videos in metadata.items():
-            for video_info in videos:
-                # Migrate video path
-                if 'path' in video_info:
-                    old_path = video_info['path']
-                    new_path = _to_relative_path(old_path)
-                    if old_path != new_path:
-                        video_info['path'] = new_path
-                        migrated = True
-
-                # Migrate audio file path
-                if 'audio_file' in video_info:
-                    old_audio = video_info['audio_file']
-                    new_audio = _to_relative_path(old_audio)
-                    if old_audio != new_audio:
-                        video_info['audio_file'] = new_audio
-                        migrated = True
+        key = _stat_key()
+    except OSError:
+        return None, {}
+    cache = _META_CACHE
+    if cache is None or cache[0] != key:
+        # Parse under the lock so an append can't land between the stat and the read
+        with _LOG_LOCK:
+            key = _stat_key()
+            cache = _META_CACHE = (key, _parse_metadata())
+    return cache
+
+def load_metadata_for_stem(audio_stem: str) -> List[Dict]:
+    """
+    Videos registered for one audio file. Served from the cache when it is current;
+    otherwise large logs are streamed, parsing only the lines for this audio.
+    """
+    ensure_video_directories()
+    try:
+        key = _stat_key()
+    except OSError:
+        return []
+    cache = _META_CACHE
+    if (cache is not None and cache[0] == key) or key[1] <= STREAM_LOAD_BYTES:
+        _, metadata = _cached_metadata()
+        return list(metadata.get(audio_stem, ()))
+
+    # Plain stems are encoded identically by json and orjson, so lines for other
+    # audio files can be skipped with a byte search before parsing
+    needle = None
+    if audio_stem.isascii() and audio_stem.isprintable() and '"' not in audio_stem and '\\' not in audio_stem:
+        needle = f'"{audio_stem}"'.encode('ascii')
+
+    metadata = {}
+    with open(METADATA_FILE, 'rb') as f:
+        for line in f:
+            if needle is not None and needle not in line:
+                continue
+            try:
+                rec = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            if rec.get('audio_stem') == audio_stem:
+                _apply_record(metadata, rec)
+    return metadata.get(audio_stem, [])
+
+def _id_index() -> Dict:
+    """Map (audio_stem, id) -> video_info for the current metadata, rebuilt only when it changes."""
+    global _ID_INDEX
+    key, metadata = _cached_metadata()
+    if _ID_INDEX is None or _ID_INDEX[0] != key:
+        _ID_INDEX = (key, {(audio_stem, v.get('id')): v
+                           for audio_stem, videos in metadata.items() for v in videos})
+    return _ID_INDEX[1]
+
+def _parse_metadata() -> Dict:
+    """Replay the metadata log, migrating absolute paths and scheduling compaction if needed."""
+    try:
+        metadata, record_count, torn, schema = _read_log()
+
+        # Migrate absolute paths to relative paths (only logs written before the schema header)
+        migrated = schema != CURRENT_SCHEMA and _normalize_in_place(metadata)
 
-        # Save migrated metadata
-        if migrated:
-            save_metadata(metadata)
+        # Save migrated metadata (stamping the schema), or compact once tombstones/superseded
+        # lines dominate - or, for a large log, as soon as there are any to drop
+        live_count = sum(len(videos) for videos in metadata.values())
+        dead_count = record_count - live_count
+        if (schema != CURRENT_SCHEMA or migrated or torn or dead_count > live_count
+                or (dead_count > 0 and os.path.getsize(METADATA_FILE) > COMPACT_LOG_BYTES)):
+            _executor.EXEC.submit(compact_metadata)
 
         return metadata
     except (json.JSONDecodeError, IOError):
         return {}
 
 def save_metadata(metadata: Dict):
-    """Save video metadata to JSON file with relative paths."""
-    ensure_video_directories()
-    # Ensure all paths are relative before saving
-    for audio_stem, videos in metadata.items():
-        for video_info in videos:
-            if 'path' in video_info:
-                video_info['path'] = _to_relative_path(video_info['path'])
-            if 'audio_file' in video_info:
-                video_info['audio_file'] = _to_relative_path(video_info['audio_file'])
-
-    with open(METADATA_FILE, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    """Rewrite the metadata log as one 'put' record per video, with relative paths."""
+    VIDEOS_ROOT.mkdir(parents=True, exist_ok=True)
+    # Cheap for already-relative entries (identity fast path in _to_relative_path)
+    _normalize_in_place(metadata)
+    with _LOG_LOCK:
+        _write_snapshot(metadata)
+
+def _write_snapshot(metadata: Dict):
+    """Write a compacted log to a temp file and swap it in atomically (call with _LOG_LOCK held)."""
+    global _META_CACHE
+    # Serialize the whole snapshot in memory and hand it to the OS in one write()
+    data = _dumps_line({'op': 'schema', 'version': CURRENT_SCHEMA}) + b''.join(
+        _dumps_line({'op': 'put', 'audio_stem': audio_stem, 'video': video_info})
+        for audio_stem, videos in metadata.items()
+        for video_info in videos
+    )
+    tmp_file = METADATA_FILE.with_suffix('.ndjson.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        # Make the new contents durable before the rename publishes them
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, METADATA_FILE)
+    # The snapshot is exactly what a replay would produce, so seed the cache with it
+    _META_CACHE = (_stat_key(), {audio_stem: list(videos) for audio_stem, videos in metadata.items() if videos})
+
+def compact_metadata():
+    """Drop tombstones and superseded records from the metadata log (migrating pre-schema paths)."""
+    try:
+        with _LOG_LOCK:
+            # Re-read under the lock so records appended since the caller's load are kept
+            metadata, _, _, schema = _read_log()
+            if schema != CURRENT_SCHEMA:
+                _normalize_in_place(metadata)
+            _write_snapshot(metadata)
+    except (OSError, ValueError) as e:
+        print(f"Error compacting video metadata: {e}")
 
 def get_video_filename(audio_stem: str, video_title: str = None) -> str:
     """
@@ -154,8 +402,8 @@ def get_video_filename(audio_stem: str, video_title: str = None) -> str:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if video_title:
         # Sanitize title for filename
-        safe_title = "".join(c for c in video_title if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_title = safe_title.replace(' ', '_')[:50]  # Limit length
+        safe_title = _TITLE_RE.sub('', video_title).strip()
+        safe_title = safe_title.translate(_SPACE_TO_UNDERSCORE)[:50]  # Limit length
         filename = f"{audio_stem}_{timestamp}_{safe_title}.mp4"
     else:
         filename = f"{audio_stem}_{timestamp}.mp4"
@@ -171,89 +419,125 @@ def register_video(audio_path: Path, video_path: Path, title: str = None, settin
     metadata = load_metadata()
 
     audio_stem = audio_path.stem
-    if audio_stem not in metadata:
-        metadata[audio_stem] = []
+    existing = metadata.get(audio_stem, [])
+    now = datetime.now()
 
     video_info = {
-        'id': len(metadata[audio_stem]) + 1,
-        'title': title or f"Video {len(metadata[audio_stem]) + 1}",
+        # max+1 rather than len+1 so ids stay unique after deletions (tombstones match on id)
+        'id': max((v.get('id', 0) for v in existing), default=0) + 1,
+        'title': title or f"Video {len(existing) + 1}",
         'filename': video_path.name,
         'path': _to_relative_path(video_path),  # Store as relative path
-        'created': datetime.now().isoformat(),
+        'created': now.isoformat(),
+        'created_ts': now.timestamp(),  # Numeric sort key for get_all_videos
         'audio_file': _to_relative_path(audio_path),  # Store as relative path
         'settings': settings or {}
     }
 
-    metadata[audio_stem].append(video_info)
-    save_metadata(metadata)
+    append_record({'op': 'put', 'audio_stem': audio_stem, 'video': video_info})
 
-    return video_info
+    # video_info itself is now held by the metadata cache; hand the caller its own copy
+    return video_info.copy()
 
 def get_videos_for_audio(audio_path: Path) -> List[Dict]:
     """Get all videos associated with an audio file."""
-    metadata = load_metadata()
     audio_stem = audio_path.stem
-    if audio_stem not in metadata:
+    registered = load_metadata_for_stem(audio_stem)
+    if not registered:
         return []
 
+    exists = _make_exists_checker()
     videos = []
-    for video_info in metadata[audio_stem]:
+    missing = []
+    kept_ids = set()
+    for video_info in registered:
         # Convert relative path to absolute for checking existence
-        video_path = _to_absolute_path(video_info['path'])
-        if video_path.exists():
+        video_path = _to_absolute_path(video_info['path'], exists)
+        if not exists(video_path):
+            # Video file doesn't exist, tombstone it below
+            missing.append({'op': 'del', 'audio_stem': audio_stem, 'id': video_info.get('id')})
+        else:
+            kept_ids.add(video_info.get('id'))
             # Return with absolute path for use in GUI
             result = video_info.copy()
             result['path'] = str(video_path)
             if 'audio_file' in video_info:
-                result['audio_file'] = str(_to_absolute_path(video_info['audio_file']))
+                result['audio_file'] = str(_to_absolute_path(video_info['audio_file'], exists))
             videos.append(result)
-        else:
-            # Video file doesn't exist, remove from metadata
-            metadata[audio_stem].remove(video_info)
 
-    save_metadata(metadata)
+    # Write to the log only when some video files have disappeared. Tombstones match by id,
+    # so skip ids still used by a live entry (older metadata could repeat ids)
+    missing = [rec for rec in missing if rec['id'] not in kept_ids]
+    if missing:
+        append_records(missing)
     return videos
 
 def get_all_videos() -> List[Dict]:
     """Get all videos from all audio files."""
     metadata = load_metadata()
     all_videos = []
+    # One directory listing per video folder instead of up to 4 stat() calls per video
+    prefetch_dirs = ()
+    if sum(len(videos) for videos in metadata.values()) > PARALLEL_LISTING_MIN_ENTRIES:
+        # Folders the videos normally live in (relative to the app root)
+        prefetch_dirs = {os.path.dirname(os.path.join(_APP_ROOT_STR, v.get('path', '')))
+                         for videos in metadata.values() for v in videos}
+    exists = _make_exists_checker(prefetch_dirs)
 
     for audio_stem, videos in metadata.items():
         for video_info in videos:
             # Convert relative path to absolute for checking existence
-            video_path = _to_absolute_path(video_info['path'])
-            if video_path.exists():
+            video_path = _to_absolute_path(video_info['path'], exists)
+            if exists(video_path):
                 # Return with absolute path for use in GUI
                 result = video_info.copy()
                 result['path'] = str(video_path)
                 if 'audio_file' in video_info:
-                    result['audio_file'] = str(_to_absolute_path(video_info['audio_file']))
+                    result['audio_file'] = str(_to_absolute_path(video_info['audio_file'], exists))
+                if 'created_ts' not in result:
+                    # Entries registered before created_ts existed
+                    result['created_ts'] = _created_ts(result.get('created', ''))
                 all_videos.append(result)
 
     # Sort by creation date (newest first)
-    all_videos.sort(key=lambda x: x.get('created', ''), reverse=True)
+    all_videos.sort(key=operator.itemgetter('created_ts'), reverse=True)
     return all_videos
 
+def _created_ts(created: str) -> float:
+    """Timestamp for an ISO 'created' string (0.0 if missing or malformed)."""
+    try:
+        return datetime.fromisoformat(created).timestamp()
+    except ValueError:
+        return 0.0
+
 def delete_video(video_info: Dict) -> bool:
     """Delete a video file and remove it from metadata."""
+    return delete_videos([video_info])
+
+def delete_videos(video_infos: List[Dict]) -> bool:
+    """Delete several video files and tombstone them in metadata with a single log append."""
     try:
-        # Convert relative path to absolute if needed
-        video_path = _to_absolute_path(video_info['path'])
-        if video_path.exists():
-            video_path.unlink()
-
-        metadata = load_metadata()
-        # Get audio stem from relative path
-        audio_file_rel = video_info.get('audio_file', '')
-        audio_stem = Path(audio_file_rel).stem if audio_file_rel else ''
-
-        if audio_stem in metadata:
-            metadata[audio_stem] = [v for v in metadata[audio_stem] if v['id'] != video_info['id']]
-            if not metadata[audio_stem]:
-                del metadata[audio_stem]
-            save_metadata(metadata)
+        index = _id_index()
+        seen = set()
+        tombstones = []
+        for video_info in video_infos:
+            # Convert relative path to absolute if needed
+            video_path = _to_absolute_path(video_info['path'])
+            if video_path.exists():
+                video_path.unlink()
+
+            # Get audio stem from relative path
+            audio_file_rel = video_info.get('audio_file', '')
+            audio_stem = Path(audio_file_rel).stem if audio_file_rel else ''
+
+            # The same video listed twice gets a single tombstone (the shared index is not modified)
+            key = (audio_stem, video_info['id'])
+            if key in index and key not in seen:
+                seen.add(key)
+                tombstones.append({'op': 'del', 'audio_stem': audio_stem, 'id': video_info['id']})
 
+        if tombstones:
+            append_records(tombstones)
         return True
     except Exception as e:
         print(f"Error deleting video: {e}")
@@ -264,8 +548,8 @@ def get_video_path(audio_stem: str, video_filename: str) -> Path:
     return VIDEOS_ROOT / audio_stem / video_filename
 
 def reset_metadata():
-    """Reset metadata.json to empty state (useful for cleaning up absolute paths)."""
+    """Reset the metadata log to empty state (useful for cleaning up absolute paths)."""
     ensure_video_directories()
-    with open(METADATA_FILE, 'w') as f:
-        json.dump({}, f, indent=2)
+    _paths_cache_clear()
+    save_metadata({})
 
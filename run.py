@@ -6,14 +6,22 @@ This script handles both GUI and CLI modes, and ensures proper environment setup
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
-# Add app directory to Python path
-APP_DIR = Path(__file__).parent / "app"
+# Add app directory to Python path (resolved once, reused by main())
+APP_DIR = (Path(__file__).parent / "app").resolve()
 sys.path.insert(0, str(APP_DIR))
 
+# Set once check_dependencies() has succeeded in this process
+_deps_checked = False
+
 def check_dependencies():
     """Check if all required dependencies are installed."""
+    global _deps_checked
+    if _deps_checked:
+        return True
+
     missing = []
     required = [
         'numpy', 'PIL', 'librosa', 'soundfile',
@@ -21,14 +29,9 @@ def check_dependencies():
     ]
 
     for module in required:
-        try:
-            if module == 'PIL':
-                __import__('PIL')
-            elif module == 'cv2':
-                __import__('cv2')
-            else:
-                __import__(module)
-        except ImportError:
+        # find_spec only locates the module on sys.path; the heavy imports
+        # (numba, librosa, cv2...) happen later, in the mode that needs them
+        if importlib.util.find_spec(module) is None:
             missing.append(module)
 
     if missing:
@@ -40,21 +43,17 @@ def check_dependencies():
         print("\nOr install manually:")
         print("  pip install -r requirements.txt")
         return False
+    _deps_checked = True
     return True
 
 def main():
     """Main entry point."""
     # Change to app directory for relative imports
     original_dir = os.getcwd()
-    app_dir = Path(__file__).parent / "app"
 
     try:
         # Change to app directory
-        os.chdir(app_dir)
-
-        # Check dependencies
-        if not check_dependencies():
-            sys.exit(1)
+        os.chdir(APP_DIR)
 
         # Parse command line arguments
         if len(sys.argv) > 1:
@@ -62,6 +61,10 @@ def main():
         else:
             mode = 'gui'  # Default to GUI
 
+        # Check dependencies (help doesn't need any)
+        if mode not in ('help', '--help', '-h') and not check_dependencies():
+            sys.exit(1)
+
         if mode == 'gui':
             # Run GUI
             try: